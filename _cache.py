@@ -0,0 +1,42 @@
+"""On-disk cache helpers shared by the contract loader and the retriever.
+
+Both caches live under `$XDG_CACHE_HOME/helmsman` (default
+`~/.cache/helmsman`) and are replaced atomically, so a concurrent or
+interrupted run never sees a half-written file. Caches are only a
+speed-up: failing to write one is not an error.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+
+def cache_dir() -> Path:
+    """Return the directory Helmsman stores its caches in."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(cache_home) / 'helmsman'
+
+
+def atomic_write(path: Path, write_fn: Callable[[str], None]) -> None:
+    """Create `path` by calling `write_fn` on a temporary file, then renaming it.
+
+    `write_fn` receives the path of an empty temporary file in the same
+    directory. Failures to create the directory, write or rename are
+    ignored and leave no temporary file behind.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+        os.close(fd)
+        try:
+            write_fn(tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        # Unwritable cache directories simply run without a cache
+        pass
@@ -0,0 +1,45 @@
+"""JSON helpers shared by the Helmsman modules.
+
+Uses `orjson` when it is installed and falls back to the standard
+library `json` module otherwise. `dumps` always returns UTF‑8 encoded
+bytes and `loads` accepts either `str` or `bytes`, so callers do not
+need to care which backend is active. `load_jsonl` reads a whole JSON
+Lines file using whichever backend is available.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        """Serialise `obj` to compact JSON bytes."""
+        return orjson.dumps(obj)
+
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # pragma: no cover - depends on the environment
+    import json
+
+    def dumps(obj: Any) -> bytes:
+        """Serialise `obj` to compact JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+
+def load_jsonl(path: str) -> List[Dict[str, Any]]:
+    """Read a JSON Lines file into a list of objects.
+
+    The file is read in a single call and split on newlines at the bytes
+    level; blank lines are skipped.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return [loads(line) for line in data.split(b"\n") if line and not line.isspace()]
+
+
+__all__ = ["dumps", "loads", "load_jsonl", "JSONDecodeError"]
@@ -0,0 +1,37 @@
+"""Text helpers shared by the answerer and TruthLens.
+
+Both components split text into naive sentences on `.`, `?` or `!`
+followed by whitespace. The pattern is compiled once here so the two
+modules share a single compiled object.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import List
+
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.?!])\s+')
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split `text` after sentence terminators followed by whitespace.
+
+    Behaves like `SENTENCE_SPLIT_RE.split(text)` but skips the regex
+    entirely when the text contains no terminator.
+    """
+    if '.' not in text and '?' not in text and '!' not in text:
+        return [text]
+    return SENTENCE_SPLIT_RE.split(text)
+
+
+def count_sentences(text: str) -> int:
+    """Return the number of non-empty pieces `split_sentences` yields.
+
+    `text` must already be stripped. The pieces are not materialised,
+    and the regex is skipped when there is no sentence terminator.
+    """
+    if not text:
+        return 0
+    if '.' not in text and '?' not in text and '!' not in text:
+        return 1
+    return len(SENTENCE_SPLIT_RE.findall(text)) + 1
@@ -8,55 +8,247 @@ The loader silently ignores files that cannot be parsed as YAML or do
 not conform to the contract schema. Any validation errors will be
 propagated to the caller. Duplicate contract IDs are allowed but
 override earlier definitions; the last one wins.
+
+Contract files are authored by developers and are treated as trusted by
+default: after a cheap structural sanity check the data is assembled
+with Pydantic's `model_construct`, bypassing full validation. Data that
+fails the sanity check, or any load with `strict=True`, goes through
+the regular `Contract(**data)` validation path.
+
+Parsed contracts are cached in a JSON file under
+`$XDG_CACHE_HOME/helmsman` (default `~/.cache/helmsman`), one file per
+contract directory. Each entry is keyed by file path and stores the
+file's modification time and size, the contract data and whether that
+data was validated. Unchanged files skip YAML parsing, and validation
+too unless a `strict=True` load finds an entry that only came from the
+trusted path. The cache is only a speed-up: if it cannot be read or
+written the loader falls back to parsing every file.
 """
 
 from __future__ import annotations
 
-import json
+import hashlib
 import os
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List
 
 import yaml
 from pydantic import ValidationError
 
-from .schemas import Contract
+try:  # prefer the libyaml bindings when available
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
+from .._cache import atomic_write, cache_dir
+from .._jsonio import dumps as json_dumps, loads as json_loads
+from .schemas import Contract, ContractDetector, ContractMessages, ContractMetrics
+
+# Bump when the layout of cached entries changes
+_CACHE_VERSION = 3
+
+
+_YAML_SUFFIXES = ('.yaml', '.yml')
 
 
 def _find_yaml_files(root: Path) -> Iterable[Path]:
     """Yield all YAML files under the given directory.
 
-    This function traverses the directory tree and yields files with
-    extension `.yml` or `.yaml`. Non-existing directories are ignored.
+    This function traverses the directory tree with `os.scandir` and
+    yields files with extension `.yml` or `.yaml`, using the cached
+    directory entry type instead of extra `stat` calls. Symlinked
+    directories are not followed. Non-existing or unreadable directories
+    are ignored.
     """
-    if not root.exists() or not root.is_dir():
+    if not root.is_dir():
         return
-    for dirpath, _, filenames in os.walk(root):
-        for name in filenames:
-            if name.lower().endswith(('.yaml', '.yml')):
-                yield Path(dirpath) / name
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            # Skip unreadable directories, as os.walk does by default
+            continue
+        with it:
+            subdirs = []
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.lower().endswith(_YAML_SUFFIXES) and entry.is_file():
+                    yield Path(entry.path)
+        # Visit subdirectories in listing order, like os.walk
+        stack.extend(reversed(subdirs))
+
+
+def _is_str_list(value: Any) -> bool:
+    return isinstance(value, str) or (
+        isinstance(value, list) and all(isinstance(v, str) for v in value)
+    )
+
+
+def _looks_valid(data: Any) -> bool:
+    """Cheap structural check used before skipping Pydantic validation.
+
+    Only unknown keys and the shape of the fields the orchestrator relies
+    on are checked; anything unexpected is left to full validation to
+    report.
+    """
+    if not isinstance(data, dict) or not data.keys() <= Contract.model_fields.keys():
+        return False
+    if not isinstance(data.get('id'), str):
+        return False
+    if not _is_str_list(data.get('applies_to')) or not _is_str_list(data.get('locales')):
+        return False
+    precondition = data.get('precondition')
+    if precondition is not None and not isinstance(precondition, str):
+        return False
+    for key in ('obligation', 'forbidden'):
+        if not isinstance(data.get(key, {}), dict):
+            return False
+    metrics = data.get('metrics')
+    if metrics is not None and not (
+        isinstance(metrics, dict)
+        and metrics.keys() <= ContractMetrics.model_fields.keys()
+        and isinstance(metrics.get('pass_criteria'), str)
+    ):
+        return False
+    detectors = data.get('detectors')
+    if detectors is not None:
+        if not isinstance(detectors, dict):
+            return False
+        for det in detectors.values():
+            if not isinstance(det, dict) or not det.keys() <= ContractDetector.model_fields.keys():
+                return False
+            if not isinstance(det.get('fn'), str) or not isinstance(det.get('args', {}), dict):
+                return False
+    messages = data.get('messages')
+    if messages is not None and not (
+        isinstance(messages, dict) and messages.keys() <= ContractMessages.model_fields.keys()
+    ):
+        return False
+    return True
+
+
+def _construct_contract(data: Dict[str, Any]) -> Contract:
+    """Build a `Contract` from trusted data without validation.
+
+    `model_construct` does not recurse into nested models or run
+    validators, so the submodels are constructed explicitly and scalar
+    topic/locale values are wrapped in lists here.
+    """
+    data = dict(data)
+    for key in ('applies_to', 'locales'):
+        if isinstance(data.get(key), str):
+            data[key] = [data[key]]
+    if data.get('metrics') is not None:
+        data['metrics'] = ContractMetrics.model_construct(**data['metrics'])
+    if data.get('detectors') is not None:
+        data['detectors'] = {
+            name: ContractDetector.model_construct(**det)
+            for name, det in data['detectors'].items()
+        }
+    if data.get('messages') is not None:
+        data['messages'] = ContractMessages.model_construct(**data['messages'])
+    return Contract.model_construct(**data)
+
+
+def _cache_file(root: Path) -> Path:
+    """Return the cache location for the contract directory `root`."""
+    key = hashlib.blake2b(str(root.resolve()).encode('utf-8'), digest_size=8).hexdigest()
+    return cache_dir() / f"contracts_{key}.json"
+
+
+def _is_json_safe(data: Dict[str, Any]) -> bool:
+    """Return True if `data` survives a JSON round trip unchanged.
+
+    YAML can produce values JSON cannot represent faithfully (dates,
+    non-string keys); contracts containing them are simply not cached.
+    """
+    try:
+        return json_loads(json_dumps(data)) == data
+    except (TypeError, ValueError):
+        return False
+
+
+def _read_cache(cache_path: Path) -> Dict[str, List[Any]]:
+    """Return the cached entries stored at `cache_path`, or an empty dict."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = json_loads(f.read())
+    except Exception:
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != _CACHE_VERSION:
+        return {}
+    entries = cache.get('entries')
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_cache(cache_path: Path, entries: Dict[str, List[Any]]) -> None:
+    """Serialise `entries` and store them as the cache file for one directory."""
+    payload = json_dumps({'version': _CACHE_VERSION, 'entries': entries})
+
+    def write(tmp: str) -> None:
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+
+    atomic_write(cache_path, write)
 
 
-def load_contracts(directory: str) -> Dict[str, Contract]:
+def load_contracts(directory: str, strict: bool = False, use_cache: bool = True) -> Dict[str, Contract]:
     """Load all contracts from YAML files in the given directory.
 
     :param directory: path to a directory containing contract YAML files
+    :param strict: run full Pydantic validation on every parsed file
+        instead of the trusted `model_construct` path
+    :param use_cache: reuse parsed contracts from the on-disk cache for
+        files whose modification time and size are unchanged
     :returns: mapping from contract id to Contract object
     :raises ValidationError: if any contract file is malformed
     """
     root = Path(directory)
+    cache_path = _cache_file(root) if use_cache else None
+    cached = _read_cache(cache_path) if cache_path is not None else {}
+    entries: Dict[str, List[Any]] = {}
     contracts: Dict[str, Contract] = {}
+    stale = False
     for path in _find_yaml_files(root):
+        key = str(path)
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            if data is None:
-                continue
-            contract = Contract(**data)
+            st = os.stat(path)
+            entry = cached.get(key)
+            if (
+                isinstance(entry, list) and len(entry) == 4
+                and entry[0] == st.st_mtime_ns and entry[1] == st.st_size
+            ):
+                validated, data = entry[2], entry[3]
+                if validated or not strict:
+                    contract = _construct_contract(data)
+                else:
+                    # Cached by a trusted load; strict loads must validate it
+                    contract = Contract.model_validate(data)
+                    entry = [st.st_mtime_ns, st.st_size, True, contract.model_dump()]
+                    stale = True
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = yaml.load(f, Loader=_YamlLoader)
+                if data is None:
+                    continue
+                if not strict and _looks_valid(data):
+                    contract = _construct_contract(data)
+                    validated, payload = False, data
+                else:
+                    contract = Contract(**data)
+                    validated, payload = True, contract.model_dump()
+                stale = True
+                entry = [st.st_mtime_ns, st.st_size, validated, payload] if _is_json_safe(payload) else None
+            if entry is not None:
+                entries[key] = entry
             contracts[contract.id] = contract
         except ValidationError as ve:
             raise ve
         except Exception:
             # Ignore files that can't be parsed as valid contracts
             continue
-    return contracts
\ No newline at end of file
+    if cache_path is not None and root.is_dir() and (stale or entries.keys() != cached.keys()):
+        _write_cache(cache_path, entries)
+    return contracts
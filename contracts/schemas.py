@@ -12,12 +12,16 @@ contracts. It deliberately does not enforce the semantics of the fields
 at load time; downstream components such as the orchestrator are
 responsible for dispatching to detector and evaluator functions based on
 the names provided in the contract definitions.
+
+Contracts are read-only once loaded, so all models are frozen. Unknown
+keys are rejected rather than silently dropped, which catches typos in
+hand-written YAML.
 """
 
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class ContractMetrics(BaseModel):
@@ -28,6 +32,8 @@ class ContractMetrics(BaseModel):
     orchestrator uses these settings to compute summary statistics.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     weight: float = Field(1.0, description="Relative importance of this contract")
     pass_criteria: str = Field(
         ..., description="Name of the function used to determine pass/fail"
@@ -41,6 +47,8 @@ class ContractMetrics(BaseModel):
 class ContractMessages(BaseModel):
     """Messages associated with contract outcomes and guidance."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     on_pass: Optional[str] = None
     on_fail_count: Optional[str] = None
     on_fail_independence: Optional[str] = None
@@ -60,6 +68,8 @@ class ContractDetector(BaseModel):
     information.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     fn: str
     args: Dict[str, Any] = Field(default_factory=dict)
 
@@ -67,6 +77,8 @@ class ContractDetector(BaseModel):
 class Contract(BaseModel):
     """Root model representing a single contract definition."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str = Field(..., description="Unique identifier for this contract")
     version: str = Field("0.1.0", description="Semantic version of the contract definition")
     description: Optional[str] = Field(None, description="Long form description")
@@ -92,8 +104,9 @@ class Contract(BaseModel):
     messages: Optional[ContractMessages] = None
     examples: Optional[List[Dict[str, Any]]] = None
 
-    @validator("applies_to", "locales", pre=True)
-    def _ensure_list(cls, v):  # type: ignore[no-self-argument]
+    @field_validator("applies_to", "locales", mode="before")
+    @classmethod
+    def _ensure_list(cls, v):
         # YAML loaders sometimes load single strings as scalars rather than lists.
         if isinstance(v, str):
             return [v]
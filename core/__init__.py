@@ -6,6 +6,6 @@ contains the orchestrator script which can be invoked from the command
 line to run a set of queries through the system and record results.
 """
 
-from .orchestrator import run_orchestration
+from .orchestrator import clear_component_cache, run_orchestration
 
-__all__ = ["run_orchestration"]
\ No newline at end of file
+__all__ = ["run_orchestration", "clear_component_cache"]
\ No newline at end of file
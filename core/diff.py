@@ -10,23 +10,21 @@ exit with a non‑zero status if any gate fails.
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-from collections import defaultdict
 from typing import Dict, List, Tuple
 
 import yaml
 
+from .._jsonio import load_jsonl
+
+try:  # prefer the libyaml bindings when available
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
 
 def _load_results(path: str) -> List[Dict]:
-    results: List[Dict] = []
-    with open(path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            results.append(json.loads(line))
-    return results
+    return load_jsonl(path)
 
 
 def _compute_pass_rates(results: List[Dict]) -> Dict[str, float]:
@@ -34,15 +32,18 @@ def _compute_pass_rates(results: List[Dict]) -> Dict[str, float]:
 
     :returns: mapping from contract_id to pass_rate in [0, 1]
     """
-    counts = defaultdict(int)
-    passes = defaultdict(int)
+    # contract_id -> [passes, total]
+    stats: Dict[str, List[int]] = {}
     for item in results:
         for res in item.get('contract_results', []):
             cid = res['id']
-            counts[cid] += 1
+            s = stats.get(cid)
+            if s is None:
+                s = stats[cid] = [0, 0]
+            s[1] += 1
             if res['passed']:
-                passes[cid] += 1
-    rates = {cid: (passes[cid] / counts[cid]) if counts[cid] else 0.0 for cid in counts}
+                s[0] += 1
+    rates = {cid: (p / t) if t else 0.0 for cid, (p, t) in stats.items()}
     return rates
 
 
@@ -86,7 +87,7 @@ def compare_runs(a_path: str, b_path: str, gates_path: str | None = None) -> int
     exit_code = 0
     if gates_path:
         with open(gates_path, 'r', encoding='utf-8') as gf:
-            gates_conf = yaml.safe_load(gf) or {}
+            gates_conf = yaml.load(gf, Loader=_YamlLoader) or {}
         passed, failed = _apply_gates(deltas, gates_conf)
         if not passed:
             print("\nGate thresholds exceeded:")
@@ -16,15 +16,18 @@ environment with no external network access.
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
+from .._jsonio import dumps as json_dumps, load_jsonl
 from ..contracts import load_contracts
-from ..contracts.schemas import Contract
+from ..contracts.schemas import Contract, ContractMessages
 from ..evals.disambiguation import detect_ambiguity, check_asked_then_answered
 from ..evals.citation_precision import detect_claims, check_citation_quality
 from ..rag.retrieve import Retriever
@@ -32,16 +35,42 @@ from ..rag.answer import Answerer
 from ..truth.truthlens_adapter import TruthLens
 
 
+# Output file buffer size and the serialised size at which rows are flushed
+_WRITE_BUFFER_SIZE = 1024 * 1024
+_FLUSH_THRESHOLD = 64 * 1024
+
+
+@lru_cache(maxsize=4)
+def _get_retriever(corpus_path: Optional[str] = None) -> Retriever:
+    """Return a shared `Retriever`, building its index on first use."""
+    return Retriever(corpus_path)
+
+
+@lru_cache(maxsize=4)
+def _get_answerer(system_prompt: str) -> Answerer:
+    """Return a shared `Answerer` for the given system prompt."""
+    return Answerer(system_prompt)
+
+
+@lru_cache(maxsize=1)
+def _get_truthlens() -> TruthLens:
+    return TruthLens()
+
+
+def clear_component_cache() -> None:
+    """Drop cached retriever/answerer instances.
+
+    `run_orchestration` reuses these components across calls in the same
+    process. Call this after the corpus or prompt files change on disk.
+    """
+    _get_retriever.cache_clear()
+    _get_answerer.cache_clear()
+    _get_truthlens.cache_clear()
+
+
 def _load_pack(path: str) -> List[Dict[str, Any]]:
     """Read a JSON Lines test pack into a list of dicts."""
-    items: List[Dict[str, Any]] = []
-    with open(path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            items.append(json.loads(line))
-    return items
+    return load_jsonl(path)
 
 
 def _load_prompts(path: str) -> Dict[str, Any]:
@@ -53,13 +82,98 @@ def _load_prompts(path: str) -> Dict[str, Any]:
     sophisticated prompt templating.
     """
     import yaml  # local import to avoid mandatory dependency
+    try:  # prefer the libyaml bindings when available
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:  # pragma: no cover - depends on the PyYAML build
+        from yaml import SafeLoader as _YamlLoader
     with open(path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
     if not isinstance(data, dict):
         raise ValueError("Prompt file must contain a mapping")
     return data
 
 
+_Precondition = Callable[[str, str], bool]
+_Check = Callable[[List[str], List[str], Dict[str, Any]], bool]
+_FailMessage = Callable[[Optional[ContractMessages]], Optional[str]]
+
+# Precondition name -> detector taking (query, answer)
+_PRECONDITIONS: Dict[str, _Precondition] = {
+    "query_is_ambiguous": lambda query, answer: detect_ambiguity(query),
+    "contains_factual_claims": lambda query, answer: detect_claims(answer),
+}
+
+# pass_criteria name -> (evaluator taking (conversation, citations, args),
+# function picking the failure message from the contract's messages).
+# The evaluator args come from the detector registered under the same name.
+_PASS_CRITERIA: Dict[str, Tuple[_Check, _FailMessage]] = {
+    "asked_then_answered": (
+        lambda conversation, citations, args: check_asked_then_answered(conversation, args),
+        # For this simple implementation we use a generic failure message
+        lambda m: m.on_fail_answered_directly if m else "Failed disambiguation contract",
+    ),
+    "precision_and_coverage": (
+        lambda conversation, citations, args: check_citation_quality(citations, args),
+        lambda m: m.on_fail_precision if m and m.on_fail_precision else "Failed citations contract",
+    ),
+}
+
+
+class _ResolvedContract(NamedTuple):
+    """Flat view of a contract with its dispatch targets looked up once."""
+
+    id: str
+    precondition: Optional[_Precondition]
+    check: Optional[_Check]
+    check_args: Dict[str, Any]
+    on_pass: Optional[str]
+    on_fail: Optional[str]
+
+
+def _resolve_contract(contract: Contract) -> _ResolvedContract:
+    """Resolve names, detector args and messages of a contract up front.
+
+    Unknown precondition or pass_criteria names resolve to None, which
+    makes the contract apply and pass by default.
+    """
+    messages = contract.messages
+    precondition = _PRECONDITIONS.get(contract.precondition) if contract.precondition else None
+    criteria = contract.metrics.pass_criteria if contract.metrics else None
+    check, on_fail = None, None
+    check_args: Dict[str, Any] = {}
+    if criteria in _PASS_CRITERIA:
+        check, fail_message = _PASS_CRITERIA[criteria]
+        on_fail = fail_message(messages)
+        if contract.detectors and criteria in contract.detectors:
+            check_args = contract.detectors[criteria].args
+    return _ResolvedContract(
+        id=contract.id,
+        precondition=precondition,
+        check=check,
+        check_args=check_args,
+        on_pass=messages.on_pass if messages else None,
+        on_fail=on_fail,
+    )
+
+
+def _evaluate_resolved(
+    contract: _ResolvedContract,
+    query: str,
+    answer: str,
+    conversation: List[str],
+    citations: List[str],
+) -> Dict[str, Any]:
+    """Evaluate an already resolved contract; see `evaluate_contract`."""
+    # Determine if contract applies based on precondition
+    if contract.precondition is not None and not contract.precondition(query, answer):
+        return {"id": contract.id, "passed": True, "message": contract.on_pass}
+    # Determine pass/fail based on pass_criteria
+    if contract.check is None:
+        return {"id": contract.id, "passed": True, "message": contract.on_pass}
+    result = bool(contract.check(conversation, citations, contract.check_args))
+    return {"id": contract.id, "passed": result, "message": contract.on_pass if result else contract.on_fail}
+
+
 def evaluate_contract(
     contract: Contract,
     query: str,
@@ -69,58 +183,75 @@ def evaluate_contract(
 ) -> Dict[str, Any]:
     """Evaluate a single contract on a query/answer pair.
 
+    Preconditions and pass criteria are looked up by name in the
+    `_PRECONDITIONS` and `_PASS_CRITERIA` dispatch tables. The
+    orchestrator resolves each contract once per run; this entry point
+    resolves on every call.
+
     :returns: dict with `id`, `passed` and optional `message`
     """
-    # Determine if contract applies based on precondition
-    applies = True
-    if contract.precondition:
-        if contract.precondition == "query_is_ambiguous":
-            applies = detect_ambiguity(query)
-        elif contract.precondition == "contains_factual_claims":
-            applies = detect_claims(answer)
-        else:
-            # Unknown precondition names default to True
-            applies = True
-    if not applies:
-        return {
-            "id": contract.id,
-            "passed": True,
-            "message": contract.messages.on_pass if contract.messages else None,
-        }
+    return _evaluate_resolved(_resolve_contract(contract), query, answer, conversation, citations)
 
-    # Determine pass/fail based on pass_criteria
-    result = True
-    message: Optional[str] = None
-    criteria = contract.metrics.pass_criteria if contract.metrics else None
-    if criteria == "asked_then_answered":
-        result = check_asked_then_answered(conversation, contract.detectors["asked_then_answered"].args if contract.detectors else {})
-        if result:
-            message = contract.messages.on_pass if contract.messages else None
-        else:
-            # choose appropriate message field
-            # For this simple implementation we use a generic failure message
-            message = contract.messages.on_fail_answered_directly if contract.messages else "Failed disambiguation contract"
-    elif criteria == "precision_and_coverage":
-        # Evaluate citation quality using the provided citations list
-        args = (
-            contract.detectors["precision_and_coverage"].args
-            if contract.detectors and "precision_and_coverage" in contract.detectors
-            else {}
-        )
-        result = check_citation_quality(citations, args)
-        if result:
-            message = contract.messages.on_pass if contract.messages else None
-        else:
-            message = (
-                contract.messages.on_fail_precision
-                if contract.messages and contract.messages.on_fail_precision
-                else "Failed citations contract"
-            )
-    else:
-        # Unknown criteria: pass by default
-        result = True
-        message = contract.messages.on_pass if contract.messages else None
-    return {"id": contract.id, "passed": bool(result), "message": message}
+
+def _index_contracts(contracts: Iterable[Contract]) -> Dict[Tuple[str, str], List[_ResolvedContract]]:
+    """Group resolved contracts by every (topic, locale) pair they apply to.
+
+    Contracts keep their load order within each bucket so results are
+    emitted in the same order as a linear scan over all contracts.
+    """
+    index: Dict[Tuple[str, str], List[_ResolvedContract]] = defaultdict(list)
+    for contract in contracts:
+        resolved = _resolve_contract(contract)
+        pairs = ((topic, locale) for topic in contract.applies_to for locale in contract.locales)
+        for key in dict.fromkeys(pairs):
+            index[key].append(resolved)
+    return dict(index)
+
+
+def _answer_queries(
+    retriever: Retriever, answerer: Answerer, queries: List[str]
+) -> List[Tuple[List[Dict[str, Any]], str, List[str]]]:
+    """Retrieve and answer a batch of queries.
+
+    :returns: one (retrieved_docs, answer, citations) tuple per query
+    """
+    retrieved_batch = retriever.retrieve_batch(queries)
+    answers_batch = answerer.answer_batch(queries, retrieved_batch)
+    return [(docs, answer, citations) for docs, (answer, citations) in zip(retrieved_batch, answers_batch)]
+
+
+def _evaluate_item(
+    item: Dict[str, Any],
+    query: str,
+    generated: Tuple[List[Dict[str, Any]], str, List[str]],
+    contracts_by_scope: Dict[Tuple[str, str], List[_ResolvedContract]],
+    run_meta: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Apply the relevant contracts to one pack item and build its result row."""
+    retrieved_docs, answer, citations = generated
+    locale = item.get("locale", "en")
+    topic = item.get("topic", "general_qa")
+    seed_id = item.get("id", "")
+    # Evaluate truth and citation quality (stubbed)
+    # In this simple implementation we do not compute claim labels
+    # Evaluate contracts
+    conversation = [query, answer]
+    contract_results = []
+    # Only contracts registered for this topic and locale apply
+    for contract in contracts_by_scope.get((topic, locale), ()):
+        res = _evaluate_resolved(contract, query, answer, conversation, citations)
+        contract_results.append(res)
+    return {
+        **run_meta,
+        "locale": locale,
+        "topic": topic,
+        "seed_id": seed_id,
+        "input_query": query,
+        "retrieved_snippets": retrieved_docs,
+        "answer": answer,
+        "citations": citations,
+        "contract_results": contract_results,
+    }
 
 
 def run_orchestration(
@@ -129,10 +260,17 @@ def run_orchestration(
     prompts: str,
     model: str,
     out: str,
+    strict: bool = False,
+    workers: int = 1,
 ) -> None:
-    """Run the evaluation pipeline and write results to JSONL file."""
+    """Run the evaluation pipeline and write results to JSONL file.
+
+    :param strict: fully validate contract files instead of trusting them
+    :param workers: number of threads used to retrieve, answer and
+        evaluate pack items; results are always written in pack order
+    """
     # Load contracts
-    contracts = load_contracts(contracts_dir)
+    contracts = load_contracts(contracts_dir, strict=strict)
     if not contracts:
         print(f"No contracts found in {contracts_dir}", file=sys.stderr)
         return
@@ -142,10 +280,10 @@ def run_orchestration(
     prompts_config = _load_prompts(prompts)
     system_prompt = prompts_config.get("system_prompt", "")
     prompt_version = prompts_config.get("version", "unknown")
-    # Initialize retrieval and answerer
-    retriever = Retriever()
-    answerer = Answerer(system_prompt)
-    truthlens = TruthLens()
+    # Initialize retrieval and answerer (reused across calls in one process)
+    retriever = _get_retriever()
+    answerer = _get_answerer(system_prompt)
+    truthlens = _get_truthlens()
 
     # Prepare output directory
     out_path = Path(out)
@@ -153,40 +291,48 @@ def run_orchestration(
     if out_dir and not out_dir.exists():
         out_dir.mkdir(parents=True, exist_ok=True)
 
-    run_id = datetime.utcnow().isoformat()
-    with open(out_path, 'w', encoding='utf-8') as f:
-        for item in pack:
-            query = item.get("input_query") or item.get("query") or ""
-            locale = item.get("locale", "en")
-            topic = item.get("topic", "general_qa")
-            seed_id = item.get("id", "")
-            # Generate answer and citations
-            retrieved_docs = retriever.retrieve(query)
-            answer, citations = answerer.answer(query, retrieved_docs)
-            # Evaluate truth and citation quality (stubbed)
-            # In this simple implementation we do not compute claim labels
-            # Evaluate contracts
-            conversation = [query, answer]
-            contract_results = []
-            for contract in contracts.values():
-                # Check if the contract applies based on topic and locale
-                if topic in contract.applies_to and locale in contract.locales:
-                    res = evaluate_contract(contract, query, answer, conversation, citations)
-                    contract_results.append(res)
-            result_item = {
-                "run_id": run_id,
-                "model_version": model,
-                "prompt_version": prompt_version,
-                "locale": locale,
-                "topic": topic,
-                "seed_id": seed_id,
-                "input_query": query,
-                "retrieved_snippets": retrieved_docs,
-                "answer": answer,
-                "citations": citations,
-                "contract_results": contract_results,
-            }
-            f.write(json.dumps(result_item) + "\n")
+    contracts_by_scope = _index_contracts(contracts.values())
+    run_meta = {
+        "run_id": datetime.utcnow().isoformat(),
+        "model_version": model,
+        "prompt_version": prompt_version,
+    }
+    queries = [item.get("input_query") or item.get("query") or "" for item in pack]
+    workers = max(1, min(workers, len(pack)))
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        mapper = executor.map if executor else map
+        # Retrieve and answer each distinct query once, one batch per worker;
+        # repeated queries in the pack reuse the same result
+        unique_queries = list(dict.fromkeys(queries))
+        chunk = -(-len(unique_queries) // workers) or 1
+        chunks = [unique_queries[i:i + chunk] for i in range(0, len(unique_queries), chunk)]
+        answered = dict(zip(
+            unique_queries,
+            (row for rows in mapper(partial(_answer_queries, retriever, answerer), chunks) for row in rows),
+        ))
+        generated = [answered[query] for query in queries]
+        results = mapper(
+            partial(_evaluate_item, contracts_by_scope=contracts_by_scope, run_meta=run_meta),
+            pack,
+            queries,
+            generated,
+        )
+        # Results arrive in pack order and are written from this thread only.
+        # Rows are serialised into one buffer and flushed in large chunks.
+        buf = bytearray()
+        with open(out_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            for result_item in results:
+                buf += json_dumps(result_item)
+                buf += b"\n"
+                if len(buf) >= _FLUSH_THRESHOLD:
+                    f.write(buf)
+                    buf.clear()
+            if buf:
+                f.write(buf)
+    finally:
+        if executor:
+            executor.shutdown()
 
 
 def main() -> None:
@@ -196,6 +342,10 @@ def main() -> None:
     parser.add_argument("--prompts", required=True, help="Path to prompt template (YAML/JSON)")
     parser.add_argument("--model", default="local", help="Model name/version to record in outputs")
     parser.add_argument("--out", required=True, help="Path to output JSONL file")
+    parser.add_argument("--strict", action="store_true", help="Fully validate contract files with Pydantic")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Number of worker threads (default: CPU count)"
+    )
     args = parser.parse_args()
     run_orchestration(
         contracts_dir=args.contracts_dir,
@@ -203,6 +353,8 @@ def main() -> None:
         prompts=args.prompts,
         model=args.model,
         out=args.out,
+        strict=args.strict,
+        workers=args.workers,
     )
 
 
@@ -11,8 +11,13 @@ provided citations meet the minimum count and independence requirements.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Dict, List
 
+# Patterns used by `detect_claims`, compiled once at import
+_DIGIT_RE = re.compile(r"\d")
+_PROPER_NOUN_RE = re.compile(r"\b[A-Z][a-zA-Z]{3,}\b")
+
 
 def detect_claims(answer: str, args: Dict = None) -> bool:
     """Heuristic to decide if an answer contains factual claims.
@@ -20,16 +25,21 @@ def detect_claims(answer: str, args: Dict = None) -> bool:
     We consider an answer to contain claims if it includes any digits
     (suggesting numeric facts), capitalised proper nouns or is simply
     long enough. This is a very rough approximation and should be
-    replaced with proper claim detection.
+    replaced with proper claim detection. `args` is currently unused;
+    results are memoised per answer string.
     """
+    return _has_claims(answer)
+
+
+@lru_cache(maxsize=4096)
+def _has_claims(answer: str) -> bool:
     if not answer or not answer.strip():
         return False
     # Contains any digit
-    if any(ch.isdigit() for ch in answer):
+    if _DIGIT_RE.search(answer):
         return True
     # Contains a capitalised word longer than 3 letters (proper noun)
-    tokens = re.findall(r"\b[A-Z][a-zA-Z]{3,}\b", answer)
-    if tokens:
+    if _PROPER_NOUN_RE.search(answer):
         return True
     # Length heuristic
     if len(answer) > 30:
@@ -8,7 +8,9 @@ replaced with more robust logic in a production system.
 
 from __future__ import annotations
 
-from typing import List, Dict
+import re
+from functools import lru_cache
+from typing import List, Dict, Optional, Pattern, Tuple
 
 
 # List of tokens that commonly indicate ambiguity (entity collisions)
@@ -24,24 +26,59 @@ AMBIGUOUS_ENTITIES = {
 RELATIVE_DATE_TERMS = {"last", "next", "this", "recent", "ago"}
 
 
+_AMBIGUITY_VOCAB = AMBIGUOUS_ENTITIES | RELATIVE_DATE_TERMS
+
+# Single compiled alternation over both vocabularies, built once at import
+_AMBIGUITY_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, sorted(_AMBIGUITY_VOCAB))) + r")\b",
+    re.IGNORECASE,
+)
+
+# Aho-Corasick automaton over the same vocabulary: one linear pass over the
+# query regardless of vocabulary size. Optional; the regex is used without it.
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    _AMBIGUITY_AC = None
+else:
+    _AMBIGUITY_AC = ahocorasick.Automaton()
+    for _term in _AMBIGUITY_VOCAB:
+        _AMBIGUITY_AC.add_word(_term.lower(), _term)
+    _AMBIGUITY_AC.make_automaton()
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _automaton_search(text: str) -> bool:
+    """Return True if any vocabulary term occurs in `text` as a whole word."""
+    for end, term in _AMBIGUITY_AC.iter(text):
+        start = end - len(term) + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end + 1 < len(text) and _is_word_char(text[end + 1]):
+            continue
+        return True
+    return False
+
+
+@lru_cache(maxsize=4096)
 def detect_ambiguity(query: str) -> bool:
     """Return True if the query contains ambiguous terms.
 
     This function checks for the presence of any token in
     `AMBIGUOUS_ENTITIES` or any relative date terms. It performs a
-    case‑insensitive substring search. This is a simplistic heuristic
-    intended for demonstration purposes.
+    case‑insensitive whole‑word search, using an Aho-Corasick automaton
+    when `pyahocorasick` is installed and a precompiled regular
+    expression otherwise. Results are memoised per query string. This
+    is a simplistic heuristic intended for demonstration purposes.
     """
-    lower = (query or "").lower()
-    if not lower:
+    if not query:
         return False
-    for term in AMBIGUOUS_ENTITIES:
-        if term in lower:
-            return True
-    for term in RELATIVE_DATE_TERMS:
-        if term in lower:
-            return True
-    return False
+    if _AMBIGUITY_AC is not None:
+        return _automaton_search(query.lower())
+    return _AMBIGUITY_RE.search(query) is not None
 
 
 def check_asked_then_answered(conversation: List[str], args: Dict) -> bool:
@@ -59,13 +96,27 @@ def check_asked_then_answered(conversation: List[str], args: Dict) -> bool:
     if not conversation or len(conversation) < 2:
         return False
     # Only examine the assistant's first response
-    assistant_response = conversation[1].lower()
-    interrogatives = args.get("clarify_interrogatives", [])
+    interrogatives = tuple(args.get("clarify_interrogatives", []))
+    return _asks_clarifying_question(conversation[1], interrogatives)
+
+
+@lru_cache(maxsize=256)
+def _interrogatives_re(interrogatives: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Compile a case-insensitive alternation of the interrogative phrases.
+
+    As with a substring test, an empty phrase matches every response.
+    """
+    if not interrogatives:
+        return None
+    return re.compile("|".join(map(re.escape, interrogatives)), re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _asks_clarifying_question(response: str, interrogatives: Tuple[str, ...]) -> bool:
+    """Memoised core of `check_asked_then_answered`."""
     # Check for question mark
-    if "?" in assistant_response:
+    if "?" in response:
         return True
-    # Check for interrogative phrases
-    for phrase in interrogatives:
-        if phrase.lower() in assistant_response:
-            return True
-    return False
\ No newline at end of file
+    # Check for interrogative phrases without lowercasing the response
+    pattern = _interrogatives_re(interrogatives)
+    return pattern is not None and pattern.search(response) is not None
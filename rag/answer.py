@@ -9,9 +9,28 @@ answerer are the identifiers of the retrieved documents.
 
 from __future__ import annotations
 
-import re
+from functools import lru_cache
 from typing import List, Dict, Tuple
 
+from .._text import split_sentences
+
+
+@lru_cache(maxsize=1024)
+def _generate(
+    system_prompt: str, query: str, doc_ids: Tuple[str, ...], doc_texts: Tuple[str, ...]
+) -> Tuple[str, Tuple[str, ...]]:
+    """Produce (answer, citation ids) for a prompt; memoised on its inputs.
+
+    The key covers everything a real model would see (system prompt,
+    query and retrieved documents), so swapping in an LLM keeps the
+    cache correct.
+    """
+    text = doc_texts[0]
+    # Split into sentences (very naive)
+    sentences = split_sentences(text.strip())
+    answer = sentences[0] if sentences else text
+    return answer, doc_ids
+
 
 class Answerer:
     def __init__(self, system_prompt: str = "") -> None:
@@ -26,7 +45,8 @@ class Answerer:
         This simplistic implementation takes the first retrieved document,
         splits its text into sentences using a naive period delimiter and
         returns the first sentence as the answer. Citations are the
-        identifiers of all retrieved documents.
+        identifiers of all retrieved documents. Identical prompts (same
+        system prompt, query and documents) are answered from a cache.
 
         :param query: the user query
         :param retrieved_docs: list of retrieved document dicts with `id` and `text`
@@ -34,10 +54,22 @@ class Answerer:
         """
         if not retrieved_docs:
             return "I'm sorry, I couldn't find any relevant information.", []
-        doc = retrieved_docs[0]
-        text = doc['text']
-        # Split into sentences (very naive)
-        sentences = re.split(r'(?<=[.?!])\s+', text.strip())
-        answer = sentences[0] if sentences else text
-        citations = [d['id'] for d in retrieved_docs]
-        return answer, citations
\ No newline at end of file
+        answer, citations = _generate(
+            self.system_prompt,
+            query,
+            tuple(d['id'] for d in retrieved_docs),
+            tuple(d['text'] for d in retrieved_docs),
+        )
+        return answer, list(citations)
+
+    def answer_batch(
+        self, queries: List[str], retrieved_docs_list: List[List[Dict[str, str]]]
+    ) -> List[Tuple[str, List[str]]]:
+        """Generate answers for several queries.
+
+        :param queries: the user queries
+        :param retrieved_docs_list: retrieved documents for each query, in
+            the same order as `queries`
+        :returns: a list of (answer, citations) tuples, one per query
+        """
+        return [self.answer(q, docs) for q, docs in zip(queries, retrieved_docs_list)]
@@ -1,27 +1,65 @@
 """Simple TF‑IDF retrieval for Helmsman.
 
-The Retriever class uses scikit‑learn's TfidfVectorizer to build a
-term‑frequency matrix over a small local corpus and computes cosine
-similarity against incoming queries. It returns the top documents as
+The Retriever class uses scikit‑learn's HashingVectorizer and
+TfidfTransformer to build a TF‑IDF matrix over a small local corpus and
+computes cosine similarity against incoming queries. It returns the top documents as
 snippets (dicts containing the text and document id). This
 implementation is deliberately minimal and does not handle large
 datasets or sophisticated ranking algorithms.
+
+The fitted vectoriser and document matrix are cached under
+`$XDG_CACHE_HOME/helmsman` (default `~/.cache/helmsman`), keyed by the
+corpus path, modification time and size, so warm starts skip the
+tokenisation and IDF passes.
 """
 
 from __future__ import annotations
 
-import json
+import hashlib
 import os
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import linear_kernel
+
+from .._cache import atomic_write, cache_dir
+from .._jsonio import JSONDecodeError, loads as json_loads
+
+# Bump when the vectoriser configuration or cached layout changes
+_INDEX_FORMAT = 3
+
+# Size of the hashed feature space used for term counts
+_N_FEATURES = 2 ** 18
+
+# Above this many documents, query scores are kept sparse rather than
+# densified into one float per document
+_SPARSE_SCORING_MIN_DOCS = 10_000
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return indices of the `k` highest scores, highest first.
+
+    Uses `np.argpartition` to select the candidates in linear time and
+    only sorts those, instead of sorting every document score.
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    neg = -scores
+    if scores.size <= k:
+        return np.argsort(neg, kind='stable')
+    idx = np.argpartition(neg, k - 1)[:k]
+    return idx[np.argsort(neg[idx], kind='stable')]
+
+
+def _object_array(values: List) -> np.ndarray:
+    """Build a 1-D object array without NumPy inferring nested shapes."""
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
 
 
 class Retriever:
-    def __init__(self, corpus_path: str | None = None, max_docs: int = 3) -> None:
+    def __init__(self, corpus_path: str | None = None, max_docs: int = 3, use_cache: bool = True) -> None:
         """Initialise the Retriever.
 
         :param corpus_path: Path to a JSONL file containing documents. Each
@@ -29,51 +67,168 @@ class Retriever:
             field. If omitted, uses a built‑in small corpus shipped with
             Helmsman under `data/corpus.jsonl`.
         :param max_docs: maximum number of snippets to return per query
+        :param use_cache: load the fitted index from the on-disk cache when
+            the corpus is unchanged, and store it after fitting otherwise
         """
         if corpus_path is None:
             corpus_path = str(Path(__file__).resolve().parent.parent / "data" / "corpus.jsonl")
         self.corpus_path = corpus_path
         self.max_docs = max_docs
-        self.docs: List[Dict[str, str]] = []
+        # Corpus stored column-wise; result dicts are only built for hits
+        self.ids: np.ndarray = np.empty(0, dtype=object)
+        self.texts: np.ndarray = np.empty(0, dtype=object)
+        cache_file = self._cache_file() if use_cache else None
+        if cache_file is not None and self._load_cached_index(cache_file):
+            return
         self._load_corpus()
-        # Build TF-IDF matrix
-        self.vectorizer = TfidfVectorizer(stop_words='english')
-        self.doc_term_matrix = self.vectorizer.fit_transform([doc['text'] for doc in self.docs])
+        if not self.texts.size:
+            raise ValueError(f"No documents with 'id' and 'text' fields in {self.corpus_path}")
+        # scikit-learn is imported here so that importing `helmsman.rag`
+        # stays cheap for code that never builds an index
+        from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+        from sklearn.pipeline import make_pipeline
+
+        # Build TF-IDF matrix. Hashing term counts avoids building a
+        # vocabulary dict; IDF weighting and L2 normalisation match
+        # TfidfVectorizer's defaults.
+        tfidf = TfidfTransformer()
+        self.vectorizer = make_pipeline(
+            HashingVectorizer(n_features=_N_FEATURES, stop_words='english', alternate_sign=False, norm=None),
+            tfidf,
+        )
+        self.doc_term_matrix = self.vectorizer.fit_transform(self.texts.tolist())
+        # Like an out-of-vocabulary term, a query term that never occurs in
+        # the corpus must not contribute to the query vector's norm
+        seen = np.zeros(_N_FEATURES, dtype=bool)
+        seen[self.doc_term_matrix.indices] = True
+        idf = tfidf.idf_.copy()
+        idf[~seen] = 0.0
+        tfidf.idf_ = idf
+        if cache_file is not None:
+            self._store_cached_index(cache_file)
+
+    @property
+    def docs(self) -> List[Dict[str, str]]:
+        """The corpus as a list of `{'id', 'text'}` dicts."""
+        return [{'id': i, 'text': t} for i, t in zip(self.ids.tolist(), self.texts.tolist())]
+
+    def _cache_file(self) -> Optional[Path]:
+        """Return the cache location for the current corpus, if it exists."""
+        import sklearn
+
+        try:
+            st = os.stat(self.corpus_path)
+        except OSError:
+            return None
+        ident = f"{os.path.abspath(self.corpus_path)}:{st.st_mtime_ns}:{st.st_size}:{sklearn.__version__}:{_INDEX_FORMAT}"
+        key = hashlib.blake2b(ident.encode('utf-8'), digest_size=8).hexdigest()
+        return cache_dir() / f"tfidf_{key}.joblib"
+
+    def _load_cached_index(self, cache_file: Path) -> bool:
+        """Restore the corpus, vectoriser and matrix from `cache_file` if possible."""
+        import joblib
+
+        try:
+            ids, texts, vectorizer, doc_term_matrix = joblib.load(cache_file)
+        except Exception:
+            return False
+        self.ids, self.texts = ids, texts
+        self.vectorizer, self.doc_term_matrix = vectorizer, doc_term_matrix
+        return True
+
+    def _store_cached_index(self, cache_file: Path) -> None:
+        """Store the corpus arrays and fitted index in `cache_file`."""
+        import joblib
+
+        index = (self.ids, self.texts, self.vectorizer, self.doc_term_matrix)
+        atomic_write(cache_file, lambda tmp: joblib.dump(index, tmp))
 
     def _load_corpus(self) -> None:
         """Load documents from the corpus file."""
         if not os.path.exists(self.corpus_path):
             raise FileNotFoundError(f"Corpus not found at {self.corpus_path}")
-        with open(self.corpus_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+        with open(self.corpus_path, 'rb') as f:
+            data = f.read()
+        lines = [line for line in data.splitlines() if line and not line.isspace()]
+        # Decode the whole corpus as one JSON array; fall back to line by
+        # line parsing (skipping bad lines) if any line is malformed
+        try:
+            objs = json_loads(b"[" + b",".join(lines) + b"]")
+        except JSONDecodeError:
+            objs = None
+        if objs is None or len(objs) != len(lines):
+            objs = []
+            for line in lines:
                 try:
-                    obj = json.loads(line)
-                    if 'id' in obj and 'text' in obj:
-                        self.docs.append({'id': obj['id'], 'text': obj['text']})
-                except json.JSONDecodeError:
+                    objs.append(json_loads(line))
+                except JSONDecodeError:
                     continue
+        docs = [obj for obj in objs if isinstance(obj, dict) and 'id' in obj and 'text' in obj]
+        self.ids = _object_array([obj['id'] for obj in docs])
+        self.texts = _object_array([obj['text'] for obj in docs])
+
+    def _snippets(self, cosine_similarities: np.ndarray) -> List[Dict[str, str]]:
+        """Build result snippets for the top scoring documents of one query."""
+        hits = np.flatnonzero(cosine_similarities > 0)
+        return self._ranked_snippets(hits, cosine_similarities[hits])
+
+    def _sparse_snippets(self, doc_idx: np.ndarray, scores: np.ndarray) -> List[Dict[str, str]]:
+        """Like `_snippets`, but only the documents in `doc_idx` have a
+        non-zero score. `doc_idx` must be in ascending order so ties are
+        broken the same way as on the dense path.
+        """
+        positive = scores > 0
+        return self._ranked_snippets(doc_idx[positive], scores[positive])
+
+    def _ranked_snippets(self, doc_idx: np.ndarray, scores: np.ndarray) -> List[Dict[str, str]]:
+        """Wrap the top `max_docs` of the positive-scored candidates in dicts.
+
+        Callers drop non-positive scores before ranking, so the top-k
+        selection only runs over documents that can be returned.
+        """
+        top = _top_k(scores, self.max_docs)
+        return [
+            {'id': doc_id, 'text': text, 'score': score}
+            for doc_id, text, score in zip(
+                self.ids[doc_idx[top]].tolist(), self.texts[doc_idx[top]].tolist(), scores[top].tolist()
+            )
+        ]
 
     def retrieve(self, query: str) -> List[Dict[str, str]]:
         """Retrieve the top documents for a query.
 
         Returns a list of dictionaries each containing `id` and `text`
-        keys. If the query is empty, returns an empty list.
+        keys. If the query is empty, returns an empty list. This is a
+        one-element call to `retrieve_batch`.
+        """
+        return self.retrieve_batch([query])[0]
+
+    def retrieve_batch(self, queries: List[str], batch_size: int = 256) -> List[List[Dict[str, str]]]:
+        """Retrieve the top documents for several queries at once.
+
+        Non-empty queries are vectorised and scored against the corpus
+        `batch_size` at a time, one sparse matrix product per batch. The
+        result for each query is the same as calling `retrieve` on it;
+        empty queries yield empty lists.
         """
-        query = (query or "").strip()
-        if not query:
-            return []
-        q_vec = self.vectorizer.transform([query])
-        cosine_similarities = linear_kernel(q_vec, self.doc_term_matrix).flatten()
-        # Get indices of top scores
-        top_idx = cosine_similarities.argsort()[-self.max_docs:][::-1]
-        snippets: List[Dict[str, str]] = []
-        for idx in top_idx:
-            score = cosine_similarities[idx]
-            if score <= 0:
-                continue
-            doc = self.docs[idx]
-            snippets.append({'id': doc['id'], 'text': doc['text'], 'score': float(score)})
-        return snippets
\ No newline at end of file
+        stripped = [(q or "").strip() for q in queries]
+        results: List[List[Dict[str, str]]] = [[] for _ in stripped]
+        positions = [i for i, q in enumerate(stripped) if q]
+        for start in range(0, len(positions), batch_size):
+            chunk = positions[start:start + batch_size]
+            q_mat = self.vectorizer.transform([stripped[i] for i in chunk])
+            # Rows of both matrices are L2-normalised, so the dot product
+            # is the cosine similarity
+            scores = q_mat @ self.doc_term_matrix.T
+            if self.doc_term_matrix.shape[0] > _SPARSE_SCORING_MIN_DOCS:
+                # Keep the scores sparse: a query only overlaps a few documents
+                scores = scores.tocsr()
+                scores.sort_indices()
+                for row, i in enumerate(chunk):
+                    lo, hi = scores.indptr[row], scores.indptr[row + 1]
+                    results[i] = self._sparse_snippets(scores.indices[lo:hi], scores.data[lo:hi])
+            else:
+                scores = scores.toarray()
+                for row, i in enumerate(chunk):
+                    results[i] = self._snippets(scores[row])
+        return results
@@ -0,0 +1,9 @@
+"""Shared pytest fixtures for the Helmsman tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_home(tmp_path, monkeypatch):
+    """Keep the contract and retriever caches out of the real `~/.cache`."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg-cache'))
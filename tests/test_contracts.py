@@ -5,6 +5,11 @@ loader correctly parses YAML files and that the detectors and evaluators
 behave as expected on simple inputs. They can be run with pytest.
 """
 
+import shutil
+
+import pytest
+from pydantic import ValidationError
+
 from helmsman.contracts import load_contracts
 from helmsman.evals.disambiguation import detect_ambiguity, check_asked_then_answered
 from helmsman.evals.citation_precision import detect_claims, check_citation_quality
@@ -32,6 +37,9 @@ def test_check_asked_then_answered():
     # No clarification -> fails
     conv3 = ['Tell me about Jordan', 'Jordan is a country in the Middle East.']
     assert not check_asked_then_answered(conv3, {'clarify_interrogatives': ['which']})
+    # An empty phrase is a substring of every response
+    assert check_asked_then_answered(conv3, {'clarify_interrogatives': ['', 'which']})
+    assert not check_asked_then_answered(conv3, {'clarify_interrogatives': []})
 
 
 def test_detect_claims():
@@ -46,4 +54,68 @@ def test_check_citation_quality():
     # With 1 citation -> fails
     assert not check_citation_quality(['doc1'], {'min_citations': 2})
     # Duplicate citations with independence required -> fails
-    assert not check_citation_quality(['doc1', 'doc1'], {'min_citations': 2, 'require_independent_domains': True})
\ No newline at end of file
+    assert not check_citation_quality(['doc1', 'doc1'], {'min_citations': 2, 'require_independent_domains': True})
+
+
+def test_load_contracts_cache(tmp_path):
+    from helmsman.contracts.schemas import ContractMetrics
+
+    shutil.copytree('helmsman/contracts/builtin', tmp_path / 'builtin')
+    directory = str(tmp_path / 'builtin')
+    first = load_contracts(directory)
+    assert list((tmp_path / 'xdg-cache' / 'helmsman').glob('contracts_*.json'))
+    assert not list((tmp_path / 'builtin').glob('.helmsman_cache*'))
+    # Second load is served from the cache and yields equivalent contracts
+    second = load_contracts(directory)
+    assert second == first
+    assert isinstance(second['disambiguate_before_answer'].metrics, ContractMetrics)
+    # Editing a file invalidates its cache entry
+    path = tmp_path / 'builtin' / 'disambiguation.yaml'
+    path.write_text(path.read_text(encoding='utf-8').replace('weight: 2.0', 'weight: 12.5'), encoding='utf-8')
+    third = load_contracts(directory)
+    assert third['disambiguate_before_answer'].metrics.weight == 12.5
+
+
+def test_load_contracts_strict_matches_trusted():
+    trusted = load_contracts('helmsman/contracts/builtin', use_cache=False)
+    strict = load_contracts('helmsman/contracts/builtin', strict=True, use_cache=False)
+    assert trusted == strict
+
+
+def test_load_contracts_strict_validates_trusted_cache(tmp_path):
+    (tmp_path / 'heavy.yaml').write_text(
+        'id: heavy\napplies_to: [general_qa]\nlocales: [en]\n'
+        'metrics: {weight: heavy, pass_criteria: no_uncited_factual_claims}\n',
+        encoding='utf-8',
+    )
+    assert load_contracts(str(tmp_path))['heavy'].metrics.weight == 'heavy'
+    with pytest.raises(ValidationError):
+        load_contracts(str(tmp_path), strict=True)
+
+
+def test_detect_ambiguity_whole_words():
+    assert detect_ambiguity('Is MERCURY hot?')
+    assert not detect_ambiguity('Flights to Chicago')
+    assert not detect_ambiguity('')
+
+
+def test_load_contracts_rejects_unknown_keys(tmp_path):
+    (tmp_path / 'typo.yaml').write_text(
+        'id: typo\napplies_to: [general_qa]\nlocales: [en]\npreconditon: query_is_ambiguous\n',
+        encoding='utf-8',
+    )
+    with pytest.raises(ValidationError):
+        load_contracts(str(tmp_path), use_cache=False)
+
+
+@pytest.mark.parametrize('strict', [False, True])
+@pytest.mark.parametrize('field', [
+    'precondition: [query_is_ambiguous]',
+    'detectors: {asked_then_answered: {fn: check_asked_then_answered, args: null}}',
+])
+def test_load_contracts_rejects_malformed_fields(tmp_path, field, strict):
+    (tmp_path / 'bad.yaml').write_text(
+        f'id: bad\napplies_to: [general_qa]\nlocales: [en]\n{field}\n', encoding='utf-8'
+    )
+    with pytest.raises(ValidationError):
+        load_contracts(str(tmp_path), strict=strict)
@@ -0,0 +1,28 @@
+"""End-to-end tests for the orchestrator on the built-in smoke pack."""
+
+import json
+
+from helmsman.core import run_orchestration
+
+
+def _run(tmp_path, name, **kwargs):
+    out = tmp_path / name
+    run_orchestration(
+        contracts_dir='helmsman/contracts/builtin',
+        packs='helmsman/packs/smoke_ambiguous_en.jsonl',
+        prompts='helmsman/prompts/v1.yaml',
+        model='test',
+        out=str(out),
+        **kwargs,
+    )
+    rows = [json.loads(line) for line in out.read_text(encoding='utf-8').splitlines()]
+    for row in rows:
+        row.pop('run_id')
+    return rows
+
+
+def test_run_orchestration_workers_preserve_order(tmp_path):
+    sequential = _run(tmp_path, 'seq.jsonl', workers=1)
+    threaded = _run(tmp_path, 'thr.jsonl', workers=3)
+    assert [row['seed_id'] for row in sequential] == ['q1', 'q2', 'q3', 'q4']
+    assert threaded == sequential
@@ -0,0 +1,35 @@
+"""Unit tests for the TF‑IDF retriever on the built‑in corpus."""
+
+import pytest
+
+import helmsman.rag.retrieve as retrieve
+from helmsman.rag.retrieve import Retriever
+
+
+def test_retrieve_batch_matches_retrieve():
+    retriever = Retriever()
+    queries = ['Who is Jordan?', '', 'Tell me about Apple.', 'zzzz']
+    assert retriever.retrieve_batch(queries) == [retriever.retrieve(q) for q in queries]
+
+
+def test_retriever_index_cache(tmp_path):
+    cold = Retriever()
+    assert list((tmp_path / 'xdg-cache' / 'helmsman').glob('tfidf_*.joblib'))
+    warm = Retriever()
+    assert warm.docs == cold.docs
+    assert warm.retrieve('Who is Jordan?') == cold.retrieve('Who is Jordan?')
+
+
+def test_retrieve_sparse_scoring_matches_dense(monkeypatch):
+    retriever = Retriever(use_cache=False)
+    queries = ['Who is Jordan?', 'apple computers river', 'zzzz', '']
+    dense = retriever.retrieve_batch(queries)
+    monkeypatch.setattr(retrieve, '_SPARSE_SCORING_MIN_DOCS', 0)
+    assert retriever.retrieve_batch(queries) == dense
+
+
+def test_retriever_rejects_empty_corpus(tmp_path):
+    corpus = tmp_path / 'corpus.jsonl'
+    corpus.write_text('{"id": "d1"}\nnot json\n', encoding='utf-8')
+    with pytest.raises(ValueError):
+        Retriever(str(corpus), use_cache=False)
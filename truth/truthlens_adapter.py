@@ -17,9 +17,10 @@ sentence boundaries.
 
 from __future__ import annotations
 
-import re
 from typing import Dict, List, Tuple
 
+from .._text import count_sentences, split_sentences
+
 
 class TruthLens:
     def __init__(self) -> None:
@@ -32,7 +33,7 @@ class TruthLens:
         claim strings. This is a crude approximation and does not
         attempt to handle abbreviations or quotes.
         """
-        sentences = re.split(r'(?<=[.?!])\s+', answer.strip())
+        sentences = split_sentences(answer.strip())
         return [s for s in sentences if s]
 
     def evaluate(self, answer: str, citations: List[str]) -> Dict[int, str]:
@@ -42,7 +43,10 @@ class TruthLens:
         "contradicted" or "unverifiable". This naive implementation
         labels all claims as "supported" if any citation is present,
         otherwise marks them "unverifiable".
+
+        Since every claim currently gets the same label, only the number
+        of claims is computed; the sentences themselves are not built.
         """
-        claims = self.analyse(answer)
+        n_claims = count_sentences(answer.strip())
         label = "supported" if citations else "unverifiable"
-        return {i: label for i in range(len(claims))}
\ No newline at end of file
+        return dict.fromkeys(range(n_claims), label)
\ No newline at end of file